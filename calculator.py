@@ -10,10 +10,14 @@ Features:
   - Color-coded buttons
   - Real-time calculation display
 """
-import argparse
+import functools
+import itertools
 import sys
-import time
-import math
+
+def sgr(*codes):
+    """Build one SGR escape sequence from several parameters, e.g. sgr('1', '96')."""
+    return '\033[' + ';'.join(codes) + 'm'
+
 
 # ANSI Color codes for terminal styling
 class Colors:
@@ -34,37 +38,126 @@ class Colors:
     BG_BLUE = '\033[44m'
     BG_CYAN = '\033[46m'
     BG_MAGENTA = '\033[45m'
+    # Bold + color merged into a single SGR sequence
+    BOLD_BLUE = sgr('1', '94')
+    BOLD_CYAN = sgr('1', '96')
+    BOLD_GREEN = sgr('1', '92')
+    BOLD_YELLOW = sgr('1', '93')
+    BOLD_RED = sgr('1', '91')
+    BOLD_MAGENTA = sgr('1', '35')
+    BOLD_WHITE = sgr('1', '97')
+    BANNER = sgr('46', '1', '94')
+    RESET_MAGENTA = sgr('0', '35')
+
+# Play spinner/pop animations on results (enabled with --animate)
+ANIMATE = False
 
 # Separator patterns
 SEPARATOR = f"{Colors.CYAN}{'='*60}{Colors.ENDC}"
 DIVIDER = f"{Colors.MAGENTA}{'─'*60}{Colors.ENDC}"
+_DIV55 = f"{Colors.MAGENTA}{'─'*55}{Colors.ENDC}"
+_BAR60 = f"{Colors.MAGENTA}{'━'*60}{Colors.ENDC}"
+
+# Pre-rendered pieces of the interactive UI (only the display value changes)
+_BANNER = (
+    f'\n{Colors.BANNER}\n'
+    '╔════════════════════════════════════════════════════════╗\n'
+    '║                                                        ║\n'
+    '║         🧮  SCIENTIFIC CALCULATOR  🧮                  ║\n'
+    '║                                                        ║\n'
+    '╚════════════════════════════════════════════════════════╝\n'
+    f'{Colors.ENDC}\n\n'
+)
+
+_DISPLAY_LINE = f'│  {Colors.BOLD_YELLOW}{{display:>52}}{Colors.MAGENTA}│'
+
+_SCREEN_TOP = (
+    f'{Colors.MAGENTA}\n'
+    '┌─────────────────────────────────────────────────────┐\n'
+)
+
+_SCREEN_TEMPLATE = (
+    _SCREEN_TOP
+    + _DISPLAY_LINE + '\n'
+    '└─────────────────────────────────────────────────────┘\n'
+    f'{Colors.ENDC}'
+)
+
+_BUTTON_ROWS = (
+    (f'{Colors.BOLD_CYAN}Function Buttons:{Colors.ENDC}', f'  {Colors.BOLD_WHITE}[AC]{Colors.ENDC}  {Colors.WHITE}[DEL]{Colors.ENDC}  {Colors.WHITE}[√]{Colors.ENDC}  {Colors.WHITE}[x²]{Colors.ENDC}  {Colors.WHITE}[x³]{Colors.ENDC}  {Colors.WHITE}[%]{Colors.ENDC}'),
+    (f'{Colors.BOLD_CYAN}Trigonometric:{Colors.ENDC}', f'  {Colors.YELLOW}[sin]{Colors.ENDC}  {Colors.YELLOW}[cos]{Colors.ENDC}  {Colors.YELLOW}[tan]{Colors.ENDC}  {Colors.YELLOW}[log]{Colors.ENDC}  {Colors.YELLOW}[ln]{Colors.ENDC}  {Colors.YELLOW}[π]{Colors.ENDC}'),
+    (f'{Colors.BOLD_CYAN}Numbers & Operations:{Colors.ENDC}', f'  {Colors.GREEN}[7]{Colors.ENDC}  {Colors.GREEN}[8]{Colors.ENDC}  {Colors.GREEN}[9]{Colors.ENDC}  {Colors.WHITE}[÷]{Colors.ENDC}  {Colors.WHITE}[×]{Colors.ENDC}'),
+    ('', f'  {Colors.GREEN}[4]{Colors.ENDC}  {Colors.GREEN}[5]{Colors.ENDC}  {Colors.GREEN}[6]{Colors.ENDC}  {Colors.WHITE}[-]{Colors.ENDC}  {Colors.WHITE}[+]{Colors.ENDC}'),
+    ('', f'  {Colors.GREEN}[1]{Colors.ENDC}  {Colors.GREEN}[2]{Colors.ENDC}  {Colors.GREEN}[3]{Colors.ENDC}  {Colors.WHITE}[.]{Colors.ENDC}  {Colors.BOLD_BLUE}[=]{Colors.ENDC}'),
+    ('', f'  {Colors.GREEN}[0]{Colors.ENDC}                    {Colors.WHITE}[()]{Colors.ENDC}'),
+)
+
+_UI_FOOTER = (
+    f'\n{_DIV55}\n'
+    f'{Colors.CYAN}Commands: help | clear | exit{Colors.ENDC}\n'
+)
+
+_STATIC_GRID = ''.join(
+    (f'{title}\n' if title else '') + f'{line}\n' for title, line in _BUTTON_ROWS
+)
+
+# Whole interactive frame; it is drawn once and then usually only the
+# display row is rewritten in place, with scrolling confined below it.
+_UI_TEMPLATE = _SCREEN_TEMPLATE + '\n' + _STATIC_GRID + _UI_FOOTER + '\n'
+_FRAME_TEMPLATE = _BANNER + _UI_TEMPLATE
+_FRAME_HEIGHT = _FRAME_TEMPLATE.count('\n')
+_DISPLAY_ROW = (_BANNER + _SCREEN_TOP).count('\n') + 1
+# Widest row (the banner box) and the room inside the display box
+_FRAME_WIDTH = 58
+_DISPLAY_WIDTH = 52
+
+_DISPLAY_TEXT = Colors.RESET_MAGENTA + _DISPLAY_LINE + Colors.ENDC
+
+# Cursor save, absolute move to the display row, redraw, cursor restore
+_DISPLAY_UPDATE = f'\033[s\033[{_DISPLAY_ROW};1H' + _DISPLAY_TEXT + '\033[K\033[u'
 
 
 def cascade_print(text, delay=0.02):
     """Print text with cascading animation effect"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
-    print()
+    import time
+    write, flush = sys.stdout.write, sys.stdout.flush
+    if delay <= 0:
+        write(text + '\n')
+        flush()
+        return
+    # Reveal one screen frame (~16ms) worth of characters per write
+    batch = max(1, int(0.016 / delay))
+    for i in range(0, len(text), batch):
+        chunk = text[i:i + batch]
+        write(chunk)
+        flush()
+        time.sleep(delay * len(chunk))
+    write('\n')
+    flush()
+
+
+_SPIN_FRAMES = tuple(f"{Colors.YELLOW}{c}{Colors.ENDC}\r" for c in '|/-\\')
 
 
 def spinner(duration=0.6, interval=0.08):
     """Simple spinner animation for the terminal."""
-    chars = ['|', '/', '-', '\\']
-    end = time.time() + duration
-    while time.time() < end:
-        for c in chars:
-            if time.time() >= end:
-                break
-            print(f"{Colors.YELLOW}{c}{Colors.ENDC}", end='\r', flush=True)
-            time.sleep(interval)
-    print(' ', end='\r', flush=True)
+    import time
+    end = time.monotonic() + duration
+    frames = itertools.cycle(_SPIN_FRAMES)
+    write, flush = sys.stdout.write, sys.stdout.flush
+    while time.monotonic() < end:
+        write(next(frames))
+        flush()
+        time.sleep(interval)
+    write(' \r')
+    flush()
 
 
 def pop_effect(text, times=2, delay=0.08):
     """Brief pop/bounce effect for showing important text."""
+    import time
     for _ in range(times):
-        print(f"{Colors.BOLD}{Colors.GREEN}{text}{Colors.ENDC}", end='\r', flush=True)
+        print(f"{Colors.BOLD_GREEN}{text}{Colors.ENDC}", end='\r', flush=True)
         time.sleep(delay)
         print(f"{Colors.YELLOW}{text}{Colors.ENDC}", end='\r', flush=True)
         time.sleep(delay)
@@ -73,7 +166,8 @@ def pop_effect(text, times=2, delay=0.08):
 
 def cascade_result(a, op_symbol, b, result):
     """Display result with cascading animation in a box"""
-    print(f'{Colors.GREEN}{Colors.BOLD}')
+    import time
+    print(f'{Colors.BOLD_GREEN}')
     print('   ╔══════════════════════════════════╗')
     cascade_print(f'   ║  {a} {op_symbol} {b}', delay=0.01)
     time.sleep(0.1)
@@ -113,6 +207,73 @@ def mod(a, b):
     return a % b
 
 
+# Maps display operator glyphs to their Python equivalents
+_TRANS = str.maketrans({'×': '*', '÷': '/'})
+
+_INF = float('inf')
+
+# Expressions only ever contain numbers and operators, so no builtins
+_EVAL_NS = {'__builtins__': {}}
+
+# Characters allowed in a normalized display expression
+_EXPR_CHARS = frozenset('0123456789.eE+-*/()% ')
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(expr):
+    """Compile a normalized expression once and reuse the code object."""
+    import warnings
+    with warnings.catch_warnings():
+        # "2(3)" compiles with a SyntaxWarning before failing at eval time
+        warnings.simplefilter('ignore', SyntaxWarning)
+        return compile(expr, '<calc>', 'eval')
+
+
+def _evaluate(s):
+    """Evaluate a display expression using ×/÷ or */ operators.
+
+    Returns None if the expression is malformed or has no numeric value.
+    """
+    expr = s.translate(_TRANS)
+    if not _EXPR_CHARS.issuperset(expr):
+        return None
+    try:
+        result = eval(_compile(expr), _EVAL_NS)
+    except (SyntaxError, ArithmeticError, TypeError):
+        # Unbalanced input such as "5 + ", a division by zero, or an
+        # implicit call like "2(3)" built from digits and parentheses
+        return None
+    return result if isinstance(result, (int, float)) else None
+
+
+@functools.lru_cache(maxsize=256)
+def _eval_display(s):
+    """Evaluate a display expression to a float, or None (cached per string)."""
+    try:
+        # Plain numbers (the common case) skip compile/eval entirely
+        val = float(s)
+    except ValueError:
+        result = _evaluate(s)
+        if result is None:
+            return None
+        try:
+            val = float(result)
+        except OverflowError:
+            # Integer results too large for a float
+            return None
+    # Digit strings too long for a float parse as inf rather than raising
+    return None if abs(val) == _INF else val
+
+
+def _fmt(x):
+    """Format a result for display, dropping the decimal point on whole numbers."""
+    if isinstance(x, float):
+        if x.is_integer():
+            return str(int(x))
+        return str(round(x, 8))
+    return str(x)
+
+
 OPS = {
     'add': add,
     'sub': sub,
@@ -122,217 +283,276 @@ OPS = {
     'mod': mod,
 }
 
+# Single-operand functions applied to the current display value, and input
+# checks for the ones with a restricted domain. Filled in by
+# _load_sci_funcs() so math is only imported for interactive mode.
+SCI_FUNCS = {}
+SCI_DOMAINS = {}
+
+
+# Button handlers: each takes the current display and the (lowercased)
+# command and returns the new display.
+def _enter_digit(display, cmd):
+    if cmd == '.' and '.' in display:
+        return display
+    return cmd if display == "0" else display + cmd
+
+
+def _operator(display, cmd):
+    return display + f" {cmd} " if display != "0" else display
+
+
+def _scientific(display, cmd):
+    val = _eval_display(display)
+    check = SCI_DOMAINS.get(cmd)
+    if val is None or (check is not None and not check(val)):
+        return "Error"
+    result = SCI_FUNCS[cmd](val)
+    # x² / x³ use plain multiplication, which overflows to inf silently
+    if abs(result) == _INF and abs(val) != _INF:
+        return "Error"
+    return _fmt(result)
+
+
+def _delete(display, cmd):
+    return display[:-1] or "0"
+
+
+def _equals(display, cmd):
+    if ANIMATE:
+        spinner(duration=0.5, interval=0.06)
+    result = _evaluate(display)
+    if result is None:
+        return "Error"
+    display = _fmt(result)
+    if ANIMATE:
+        pop_effect(f' ➜ {display}', times=2, delay=0.06)
+    else:
+        print(f' ➜ {display}')
+    return display
+
+
+def _open_paren(display, cmd):
+    return "(" if display == "0" else display + "("
+
+
+def _close_paren(display, cmd):
+    return display + ")"
+
+
+DISPATCH = {
+    **dict.fromkeys(('+', '-', '*', 'x', '×', '/', '÷'), _operator),
+    'del': _delete,
+    '=': _equals,
+    '(': _open_paren,
+    ')': _close_paren,
+}
+
+
+def _load_sci_funcs():
+    """Populate SCI_FUNCS and register the math-based buttons in DISPATCH."""
+    if SCI_FUNCS:
+        return
+    import math
+    # Hoisted math lookups for the function buttons
+    deg2rad = math.pi / 180.0
+    sin, cos, tan = math.sin, math.cos, math.tan
+    SCI_FUNCS.update({
+        'sin': lambda v: sin(v * deg2rad),
+        'cos': lambda v: cos(v * deg2rad),
+        'tan': lambda v: tan(v * deg2rad),
+        'log': math.log10,
+        'ln': math.log,
+        'sqrt': math.sqrt,
+        '√': math.sqrt,
+        'x²': lambda v: v * v,
+        'x^2': lambda v: v * v,
+        'x³': lambda v: v * v * v,
+        'x^3': lambda v: v * v * v,
+        '%': lambda v: v / 100,
+    })
+    finite = math.isfinite
+    SCI_DOMAINS.update({
+        'sin': finite,
+        'cos': finite,
+        'tan': finite,
+        'log': lambda v: v > 0,
+        'ln': lambda v: v > 0,
+        'sqrt': lambda v: v >= 0,
+        '√': lambda v: v >= 0,
+    })
+    DISPATCH.update(dict.fromkeys(SCI_FUNCS, _scientific))
+    pi = str(math.pi)
+    DISPATCH['π'] = lambda display, cmd: pi
+
+
+def parse_fast(argv):
+    """Parse the common `<operation> <a> <b>` form without argparse.
+
+    Returns an (operation, a, b) tuple, or None if argv needs the full parser.
+    """
+    if len(argv) != 3 or argv[0] not in OPS:
+        return None
+    try:
+        return argv[0], float(argv[1]), float(argv[2])
+    except ValueError:
+        return None
+
 
 def parse_args(argv):
+    import argparse  # only needed for help and malformed input
     p = argparse.ArgumentParser(description='Simple CLI calculator')
     p.add_argument('operation', nargs='?', choices=OPS.keys(), help='operation')
     p.add_argument('a', nargs='?', type=float, help='first operand')
     p.add_argument('b', nargs='?', type=float, help='second operand')
     p.add_argument('-i', '--interactive', action='store_true', help='run interactive prompt')
+    p.add_argument('--animate', action='store_true', help='animate results in interactive mode')
     return p.parse_args(argv)
 
 
 def interactive_prompt():
-    # Display scientific calculator UI
-    print(f'\n{Colors.BG_CYAN}{Colors.BOLD}{Colors.BLUE}')
-    cascade_print('╔════════════════════════════════════════════════════════╗', delay=0.01)
-    cascade_print('║                                                        ║', delay=0.01)
-    cascade_print('║         🧮  SCIENTIFIC CALCULATOR  🧮                  ║', delay=0.02)
-    cascade_print('║                                                        ║', delay=0.01)
-    cascade_print('╚════════════════════════════════════════════════════════╝', delay=0.01)
-    print(f'{Colors.ENDC}\n')
+    _load_sci_funcs()
     
+    # Display scientific calculator UI
     display = "0"
     history = []
+    # Pin the frame to the top of the screen only when it fits without
+    # wrapping and leaves at least two rows for the scroll region (DECSTBM
+    # needs top < bottom); otherwise print updates inline
+    pinned = False
+    if sys.stdout.isatty():
+        import shutil
+        size = shutil.get_terminal_size()
+        pinned = size.lines > _FRAME_HEIGHT + 1 and size.columns >= _FRAME_WIDTH
+    
+    def shown():
+        # A pinned row must not wrap, so long values keep only their tail
+        if pinned and len(display) > _DISPLAY_WIDTH:
+            return {'display': '…' + display[1 - _DISPLAY_WIDTH:]}
+        return {'display': display}
     
     def show_ui():
-        nonlocal display
-        # Display screen
-        print(f'{Colors.MAGENTA}')
-        print('┌─────────────────────────────────────────────────────┐')
-        print(f'│  {Colors.YELLOW}{Colors.BOLD}{display:>52}{Colors.MAGENTA}│')
-        print('└─────────────────────────────────────────────────────┘')
-        print(f'{Colors.ENDC}')
-        
-        # Animated button grid entrance
-        rows = [
-            (f'{Colors.CYAN}{Colors.BOLD}Function Buttons:{Colors.ENDC}', f'  {Colors.WHITE}{Colors.BOLD}[AC]{Colors.ENDC}  {Colors.WHITE}[DEL]{Colors.ENDC}  {Colors.WHITE}[√]{Colors.ENDC}  {Colors.WHITE}[x²]{Colors.ENDC}  {Colors.WHITE}[x³]{Colors.ENDC}  {Colors.WHITE}[%]{Colors.ENDC}'),
-            (f'{Colors.CYAN}{Colors.BOLD}Trigonometric:{Colors.ENDC}', f'  {Colors.YELLOW}[sin]{Colors.ENDC}  {Colors.YELLOW}[cos]{Colors.ENDC}  {Colors.YELLOW}[tan]{Colors.ENDC}  {Colors.YELLOW}[log]{Colors.ENDC}  {Colors.YELLOW}[ln]{Colors.ENDC}  {Colors.YELLOW}[π]{Colors.ENDC}'),
-            (f'{Colors.CYAN}{Colors.BOLD}Numbers & Operations:{Colors.ENDC}', f'  {Colors.GREEN}[7]{Colors.ENDC}  {Colors.GREEN}[8]{Colors.ENDC}  {Colors.GREEN}[9]{Colors.ENDC}  {Colors.WHITE}[÷]{Colors.ENDC}  {Colors.WHITE}[×]{Colors.ENDC}'),
-            ('', f'  {Colors.GREEN}[4]{Colors.ENDC}  {Colors.GREEN}[5]{Colors.ENDC}  {Colors.GREEN}[6]{Colors.ENDC}  {Colors.WHITE}[-]{Colors.ENDC}  {Colors.WHITE}[+]{Colors.ENDC}'),
-            ('', f'  {Colors.GREEN}[1]{Colors.ENDC}  {Colors.GREEN}[2]{Colors.ENDC}  {Colors.GREEN}[3]{Colors.ENDC}  {Colors.WHITE}[.]{Colors.ENDC}  {Colors.BLUE}{Colors.BOLD}[=]{Colors.ENDC}'),
-            ('', f'  {Colors.GREEN}[0]{Colors.ENDC}                    {Colors.WHITE}[()]{Colors.ENDC}'),
-        ]
-        for title, line in rows:
-            if title:
-                cascade_print(title, delay=0.005)
-            cascade_print(line, delay=0.004)
-            time.sleep(0.06)
-
-        print(f'\n{Colors.MAGENTA}{"─"*55}{Colors.ENDC}')
-        print(f'{Colors.CYAN}Commands: help | clear | exit{Colors.ENDC}\n')
+        ui = _UI_TEMPLATE.format_map(shown())
+        if pinned:
+            # Repaint the pinned frame above the scroll region
+            ui = f'\033[s\033[H{_BANNER}{ui}\033[u'
+        sys.stdout.write(ui)
+        sys.stdout.flush()
     
-    show_ui()
+    def redraw_display():
+        if pinned:
+            sys.stdout.write(_DISPLAY_UPDATE.format_map(shown()))
+        else:
+            sys.stdout.write(_DISPLAY_TEXT.format_map({'display': display}) + '\n')
+        sys.stdout.flush()
     
-    while True:
-        try:
-            cmd = input(f'{Colors.YELLOW}{Colors.BOLD}➜ Enter button or operation:{Colors.ENDC} ').strip()
-        except (EOFError, KeyboardInterrupt):
-            print(f'\n{Colors.GREEN}{Colors.BOLD}✨ Thanks for using Calculator! Goodbye! ✨{Colors.ENDC}\n')
-            return
-        
-        if not cmd:
-            continue
-        
-        if cmd.lower() in ('exit', 'quit'):
-            print(f'{Colors.GREEN}{Colors.BOLD}✨ Thanks for using Calculator! Goodbye! ✨{Colors.ENDC}\n')
-            return
-        
-        if cmd.lower() == 'clear' or cmd.lower() == 'ac':
-            display = "0"
-            print(f'\n{Colors.CYAN}Screen cleared!{Colors.ENDC}\n')
-            show_ui()
-            continue
-        
-        if cmd.lower() == 'help':
-            print(f'\n{Colors.CYAN}{Colors.BOLD}')
-            print('╔═══════════════════════════════════════════════╗')
-            print('║           📚 AVAILABLE OPERATIONS             ║')
-            print('╠═══════════════════════════════════════════════╣')
-            print('║  Numbers: 0-9                                 ║')
-            print('║  Basic: + - × ÷ =                             ║')
-            print('║  Power: x² x³ x^y √                           ║')
-            print('║  Trig: sin cos tan (in degrees)               ║')
-            print('║  Log: log (base 10) ln (natural log)          ║')
-            print('║  Other: π % ( ) AC DEL                        ║')
-            print('╚═══════════════════════════════════════════════╝')
-            print(f'{Colors.ENDC}\n')
-            continue
-        
-        # Parse input
-        cmd_lower = cmd.lower()
-        
-        try:
-            # Number input
-            if cmd.isdigit() or (cmd == '.' and '.' not in display):
-                if display == "0":
-                    display = cmd
-                else:
-                    display += cmd
+    def release_screen():
+        if pinned:
+            # Drop the scroll region without moving the cursor
+            sys.stdout.write('\033[s\033[r\033[u')
+            sys.stdout.flush()
+    
+    frame = _FRAME_TEMPLATE.format_map({'display': display})
+    if pinned:
+        # Clear the screen, draw the frame at the top and keep it pinned there
+        frame = f'\033[H\033[2J{frame}\033[{_FRAME_HEIGHT + 1};r\033[{_FRAME_HEIGHT + 1};1H'
+    sys.stdout.write(frame)
+    sys.stdout.flush()
+    
+    try:
+        while True:
+            try:
+                cmd = input(f'{Colors.BOLD_YELLOW}➜ Enter button or operation:{Colors.ENDC} ').strip()
+            except (EOFError, KeyboardInterrupt):
+                print(f'\n{Colors.BOLD_GREEN}✨ Thanks for using Calculator! Goodbye! ✨{Colors.ENDC}\n')
+                return
             
-            # Operations
-            elif cmd in ['+', '-', '*', 'x', '×', '/', '÷']:
-                if display != "0":
-                    display += f" {cmd} "
+            if not cmd:
+                continue
             
-            # Scientific functions
-            elif cmd_lower == 'sin':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.sin(math.radians(val))
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower == 'cos':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.cos(math.radians(val))
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower == 'tan':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.tan(math.radians(val))
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower == 'log':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.log10(val)
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower == 'ln':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.log(val)
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower == 'sqrt' or cmd == '√':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = math.sqrt(val)
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd == 'π':
-                display = str(math.pi)
-            elif cmd_lower == 'del':
-                display = display[:-1] if len(display) > 1 else "0"
-            elif cmd == '%':
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    display = str(val / 100)
-                except:
-                    display = "Error"
-            elif cmd == '=':
-                try:
-                    # show spinner while calculating
-                    spinner(duration=0.5, interval=0.06)
-                    result = eval(display.replace('×', '*').replace('÷', '/'))
-                    if isinstance(result, float) and result.is_integer():
-                        display = str(int(result))
-                    else:
-                        display = str(round(result, 8))
-                    history.append(f'{display}')
-                    # pop effect for the result
-                    pop_effect(f' ➜ {display}', times=2, delay=0.06)
-                except Exception:
-                    display = "Error"
-            elif cmd == '(':
-                if display == "0":
-                    display = "("
+            if cmd.lower() in ('exit', 'quit'):
+                print(f'{Colors.BOLD_GREEN}✨ Thanks for using Calculator! Goodbye! ✨{Colors.ENDC}\n')
+                return
+            
+            if cmd.lower() == 'clear' or cmd.lower() == 'ac':
+                display = "0"
+                print(f'\n{Colors.CYAN}Screen cleared!{Colors.ENDC}\n')
+                show_ui()
+                continue
+            
+            if cmd.lower() == 'help':
+                sys.stdout.write('\n'.join((
+                    f'\n{Colors.BOLD_CYAN}',
+                    '╔═══════════════════════════════════════════════╗',
+                    '║           📚 AVAILABLE OPERATIONS             ║',
+                    '╠═══════════════════════════════════════════════╣',
+                    '║  Numbers: 0-9                                 ║',
+                    '║  Basic: + - × ÷ =                             ║',
+                    '║  Power: x² x³ x^y √                           ║',
+                    '║  Trig: sin cos tan (in degrees)               ║',
+                    '║  Log: log (base 10) ln (natural log)          ║',
+                    '║  Other: π % ( ) AC DEL                        ║',
+                    '╚═══════════════════════════════════════════════╝',
+                    f'{Colors.ENDC}\n',
+                )) + '\n')
+                show_ui()
+                continue
+            
+            # Parse input
+            cmd_lower = cmd.lower()
+            
+            try:
+                # Typing only changes the display row; '=' repaints everything
+                needs_full_redraw = False
+                # Number input
+                if cmd.isdigit() or cmd == '.':
+                    display = _enter_digit(display, cmd)
                 else:
-                    display += "("
-            elif cmd == ')':
-                display += ")"
-            elif cmd_lower in ['x²', 'x^2']:
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = val ** 2
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
-            elif cmd_lower in ['x³', 'x^3']:
-                try:
-                    val = float(eval(display.replace('×', '*').replace('÷', '/')))
-                    result = val ** 3
-                    display = str(round(result, 8))
-                except:
-                    display = "Error"
+                    handler = DISPATCH.get(cmd_lower)
+                    if handler is not None:
+                        display = handler(display, cmd_lower)
+                        if handler is _equals:
+                            needs_full_redraw = True
+                            if display != "Error":
+                                history.append(display)
+                
+                if needs_full_redraw:
+                    show_ui()
+                else:
+                    redraw_display()
             
-            print()
-            show_ui()
-        
-        except Exception as e:
-            print(f'{Colors.RED}❌ Invalid input: {e}{Colors.ENDC}\n')
-            show_ui()
+            except Exception as e:
+                print(f'{Colors.RED}❌ Invalid input: {e}{Colors.ENDC}\n')
+                show_ui()
+    finally:
+        release_screen()
 
 
 def main(argv=None):
+    global ANIMATE
     argv = argv if argv is not None else sys.argv[1:]
-    args = parse_args(argv)
+    ANIMATE = '--animate' in argv
     
-    if args.interactive:
+    # Exactly -i/--interactive (plus an optional --animate) skips argparse;
+    # anything else, such as -i --help, goes through the full parser
+    if [arg for arg in argv if arg != '--animate'] in (['-i'], ['--interactive']):
         interactive_prompt()
         return
     
-    if not args.operation or args.a is None or args.b is None:
+    parsed = parse_fast(argv)
+    if parsed is None:
+        args = parse_args(argv)
+        # argparse also accepts abbreviations such as --inter and --anim
+        ANIMATE = args.animate
+        if args.interactive:
+            interactive_prompt()
+            return
+        parsed = (args.operation, args.a, args.b)
+    operation, a, b = parsed
+    
+    if not operation or a is None or b is None:
         # Display very attractive help screen with cascading effect
-        print(f'\n{Colors.BG_CYAN}{Colors.BLUE}{Colors.BOLD}')
+        print(f'\n{Colors.BANNER}')
         cascade_print('╔════════════════════════════════════════════════════════╗', delay=0.01)
         cascade_print('║                                                        ║', delay=0.01)
         cascade_print('║           📱 STYLISH CALCULATOR v2.0 📱                ║', delay=0.02)
@@ -340,42 +560,40 @@ def main(argv=None):
         cascade_print('║          Your Gateway to Colorful Math 🌈             ║', delay=0.015)
         cascade_print('║                                                        ║', delay=0.01)
         cascade_print('╚════════════════════════════════════════════════════════╝', delay=0.01)
-        print(f'{Colors.ENDC}\n')
-        print(f'{Colors.CYAN}{Colors.BOLD}Usage:{Colors.ENDC}')
-        print(f'  {Colors.MAGENTA}<operation> <num1> <num2>{Colors.ENDC}')
-        print(f'\n{Colors.CYAN}{Colors.BOLD}🎨 Operations:{Colors.ENDC}')
-        print(f'┌─ {Colors.YELLOW}add{Colors.ENDC}  →  Addition       {Colors.CYAN}Example: add 5 3{Colors.ENDC}')
-        print(f'├─ {Colors.YELLOW}sub{Colors.ENDC}  →  Subtraction    {Colors.CYAN}Example: sub 10 4{Colors.ENDC}')
-        print(f'├─ {Colors.YELLOW}mul{Colors.ENDC}  →  Multiplication {Colors.CYAN}Example: mul 6 7{Colors.ENDC}')
-        print(f'├─ {Colors.YELLOW}div{Colors.ENDC}  →  Division       {Colors.CYAN}Example: div 20 4{Colors.ENDC}')
-        print(f'├─ {Colors.YELLOW}pow{Colors.ENDC}  →  Power          {Colors.CYAN}Example: pow 2 8{Colors.ENDC}')
-        print(f'└─ {Colors.YELLOW}mod{Colors.ENDC}  →  Modulo         {Colors.CYAN}Example: mod 10 3{Colors.ENDC}')
-        print(f'\n{Colors.MAGENTA}{Colors.BOLD}✨ Interactive Mode:{Colors.ENDC}')
-        print(f'  {Colors.YELLOW}--interactive{Colors.ENDC}  {Colors.CYAN}(or -i for short){Colors.ENDC}')
-        print(f'\n{Colors.MAGENTA}{"━"*60}{Colors.ENDC}\n')
+        sys.stdout.write('\n'.join((
+            f'{Colors.ENDC}\n',
+            f'{Colors.BOLD_CYAN}Usage:{Colors.ENDC}',
+            f'  {Colors.MAGENTA}<operation> <num1> <num2>{Colors.ENDC}',
+            f'\n{Colors.BOLD_CYAN}🎨 Operations:{Colors.ENDC}',
+            f'┌─ {Colors.YELLOW}add{Colors.ENDC}  →  Addition       {Colors.CYAN}Example: add 5 3{Colors.ENDC}',
+            f'├─ {Colors.YELLOW}sub{Colors.ENDC}  →  Subtraction    {Colors.CYAN}Example: sub 10 4{Colors.ENDC}',
+            f'├─ {Colors.YELLOW}mul{Colors.ENDC}  →  Multiplication {Colors.CYAN}Example: mul 6 7{Colors.ENDC}',
+            f'├─ {Colors.YELLOW}div{Colors.ENDC}  →  Division       {Colors.CYAN}Example: div 20 4{Colors.ENDC}',
+            f'├─ {Colors.YELLOW}pow{Colors.ENDC}  →  Power          {Colors.CYAN}Example: pow 2 8{Colors.ENDC}',
+            f'└─ {Colors.YELLOW}mod{Colors.ENDC}  →  Modulo         {Colors.CYAN}Example: mod 10 3{Colors.ENDC}',
+            f'\n{Colors.BOLD_MAGENTA}✨ Interactive Mode:{Colors.ENDC}',
+            f'  {Colors.YELLOW}--interactive{Colors.ENDC}  {Colors.CYAN}(or -i for short){Colors.ENDC}',
+            f'\n{_BAR60}\n',
+        )) + '\n')
         return
     
-    func = OPS[args.operation]
+    func = OPS[operation]
     
     try:
-        result = func(args.a, args.b)
+        result = func(a, b)
     except ZeroDivisionError:
-        print(f'{Colors.RED}{Colors.BOLD}❌ Error: Cannot divide by zero{Colors.ENDC}')
+        print(f'{Colors.BOLD_RED}❌ Error: Cannot divide by zero{Colors.ENDC}')
         return
     except Exception as e:
-        print(f'{Colors.RED}{Colors.BOLD}❌ Error: {e}{Colors.ENDC}')
+        print(f'{Colors.BOLD_RED}❌ Error: {e}{Colors.ENDC}')
         return
     
     # Format result nicely
     op_symbol = {
         'add': '+', 'sub': '-', 'mul': '×', 'div': '÷', 'pow': '^', 'mod': 'mod'
-    }.get(args.operation, args.operation)
-    
-    # Print integer results without decimal when possible
-    if isinstance(result, float) and result.is_integer():
-        result = int(result)
+    }.get(operation, operation)
     
-    print(f'{Colors.GREEN}{Colors.BOLD}✅ {args.a} {op_symbol} {args.b} = {Colors.YELLOW}{result}{Colors.ENDC}')
+    print(f'{Colors.BOLD_GREEN}✅ {a} {op_symbol} {b} = {Colors.YELLOW}{_fmt(result)}{Colors.ENDC}')
 
 
 if __name__ == '__main__':